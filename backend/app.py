@@ -3,11 +3,21 @@ Flask Backend API - Educational Project
 Ties together scraper and data processor
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
+import orjson
 import scraper
 import data_processor
+import threading
+import time
 import traceback
+from collections import OrderedDict
+
+# Recent search responses, keyed by (route, normalized search term)
+_RESULT_CACHE_TTL = 600  # seconds
+_RESULT_CACHE_SIZE = 256
+_result_cache = OrderedDict()
+_result_cache_lock = threading.Lock()
 
 
 def create_app():
@@ -52,6 +62,68 @@ def create_app():
     return app
 
 
+def ojsonify(data, status=200):
+    """
+    Serializes a response with orjson (much faster than jsonify for large result lists)
+
+    Parameters:
+        data (dictionary): Response body
+        status (int): HTTP status code
+
+    Returns:
+        Flask Response with JSON body
+    """
+    return Response(orjson.dumps(data), status=status, mimetype='application/json')
+
+
+def get_cached_result(route, search_term):
+    """
+    Looks up a recent response for the same search
+
+    Parameters:
+        route (string): Which search pipeline produced the response
+        search_term (string): Search term as submitted
+
+    Returns:
+        Cached response dictionary, or None if missing or expired
+    """
+    key = (route, search_term.lower())
+    with _result_cache_lock:
+        entry = _result_cache.get(key)
+        if entry is None:
+            return None
+
+        stored_at, response = entry
+        if time.monotonic() - stored_at > _RESULT_CACHE_TTL:
+            del _result_cache[key]
+            return None
+
+        _result_cache.move_to_end(key)
+        return response
+
+
+def cache_result(route, search_term, response):
+    """
+    Stores a response so identical searches skip the scrape
+
+    Parameters:
+        route (string): Which search pipeline produced the response
+        search_term (string): Search term as submitted
+        response (dictionary): Response to cache
+
+    Returns:
+        None
+    """
+    key = (route, search_term.lower())
+    with _result_cache_lock:
+        _result_cache[key] = (time.monotonic(), response)
+        _result_cache.move_to_end(key)
+
+        # Evict least recently used entries
+        while len(_result_cache) > _RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
+
 def route_search():
     """
     Calls scraper.py methods, returns structured data
@@ -77,6 +149,11 @@ def route_search():
                 'message': 'Search term is required'
             }), 400
 
+        cached = get_cached_result('maps', search_term)
+        if cached is not None:
+            print(f"Serving cached results for: {search_term}")
+            return ojsonify(cached)
+
         print(f"Searching for: {search_term}")
 
         # Step 1: Search business directory
@@ -100,8 +177,9 @@ def route_search():
 
         # Step 3: Process and clean data
         response = data_processor.process_scraped_data(raw_data, search_term)
+        cache_result('maps', search_term, response)
 
-        return jsonify(response)
+        return ojsonify(response)
 
     except Exception as e:
         print(f"Error in route_search: {e}")
@@ -137,6 +215,11 @@ def route_search_google():
                 'message': 'Search term is required'
             }), 400
 
+        cached = get_cached_result('google', search_term)
+        if cached is not None:
+            print(f"Serving cached results for: {search_term}")
+            return ojsonify(cached)
+
         print(f"Google Search method for: {search_term}")
 
         # Use Google Search scraper
@@ -155,8 +238,9 @@ def route_search_google():
 
         # Process and clean data
         response = data_processor.process_scraped_data(raw_data, search_term)
+        cache_result('google', search_term, response)
 
-        return jsonify(response)
+        return ojsonify(response)
 
     except Exception as e:
         print(f"Error in route_search_google: {e}")
@@ -203,14 +287,16 @@ def error_handler(error):
     }), 500
 
 
-def run_app(host='127.0.0.1', port=5000, debug=True):
+def run_app(host='127.0.0.1', port=5000, debug=True, threads=8):
     """
-    Starts Flask development server
+    Starts the API - Flask development server in debug mode,
+    otherwise the multi-threaded waitress WSGI server
 
     Parameters:
         host (string): Host address
         port (int): Port number
         debug (boolean): Debug mode flag
+        threads (int): Worker threads for waitress (concurrent searches)
 
     Returns:
         None
@@ -219,7 +305,14 @@ def run_app(host='127.0.0.1', port=5000, debug=True):
     print(f"Starting Web Scraper API on http://{host}:{port}")
     print("IMPORTANT: This is for educational purposes only.")
     print("Always check robots.txt and Terms of Service before scraping.")
-    app.run(host=host, port=port, debug=debug)
+
+    if debug:
+        app.run(host=host, port=port, debug=debug, threaded=True)
+        return
+
+    # A search blocks its thread for the whole scrape, so serve several at once
+    from waitress import serve
+    serve(app, host=host, port=port, threads=threads)
 
 
 if __name__ == '__main__':
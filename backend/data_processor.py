@@ -4,7 +4,13 @@ Cleans and formats scraped data
 """
 
 import re
-from datetime import datetime
+from datetime import datetime, timezone
+
+# Compiled once at import instead of on every call
+_EMAIL_RE = re.compile(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$')
+_NON_DIGIT_RE = re.compile(r'\D')
+# Deletes every non-digit ASCII character in one C-level str.translate pass
+_ASCII_NON_DIGITS = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
 
 
 def validate_email(email_string):
@@ -20,8 +26,7 @@ def validate_email(email_string):
     if not email_string:
         return False
 
-    email_pattern = r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$'
-    return bool(re.match(email_pattern, email_string))
+    return bool(_EMAIL_RE.match(email_string))
 
 
 def format_phone(phone_string):
@@ -37,8 +42,11 @@ def format_phone(phone_string):
     if not phone_string:
         return None
 
-    # Remove all non-digit characters
-    digits = re.sub(r'\D', '', phone_string)
+    # Remove all non-digit characters (regex only needed for non-ASCII input)
+    if phone_string.isascii():
+        digits = phone_string.translate(_ASCII_NON_DIGITS)
+    else:
+        digits = _NON_DIGIT_RE.sub('', phone_string)
 
     # Format for Indian numbers (10 digits)
     if len(digits) == 10:
@@ -107,15 +115,10 @@ def remove_duplicates(data_list):
     unique_data = []
 
     for item in data_list:
-        # Create a unique identifier using business name or email or phone
-        identifier = (
-            item.get('business_name', '').lower(),
-            item.get('email', ''),
-            item.get('phone', '')
-        )
+        identifier = _dedup_key(item)
 
         # Skip if all fields are empty
-        if not any(identifier):
+        if identifier is None:
             continue
 
         # Check if we've seen this combination before
@@ -126,6 +129,26 @@ def remove_duplicates(data_list):
     return unique_data
 
 
+def _dedup_key(item):
+    """
+    Builds the normalized identifier used to spot duplicate contacts
+
+    Parameters:
+        item (dictionary): Contact dictionary
+
+    Returns:
+        Tuple of (business name, email, phone), or None if all are empty
+    """
+    # Missing and None fields both count as empty; name and email compare case-insensitively
+    name = (item.get('business_name') or '').strip().lower()
+    email = (item.get('email') or '').lower()
+    phone = item.get('phone') or ''
+
+    if not (name or email or phone):
+        return None
+    return (name, email, phone)
+
+
 def structure_response(cleaned_data, search_term=""):
     """
     Wraps data in response structure with metadata
@@ -142,7 +165,7 @@ def structure_response(cleaned_data, search_term=""):
         "search_term": search_term,
         "results_count": len(cleaned_data),
         "data": cleaned_data,
-        "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        "timestamp": datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace('+00:00', 'Z')
     }
 
     return response
@@ -159,17 +182,25 @@ def process_scraped_data(raw_data_list, search_term=""):
     Returns:
         Structured JSON response
     """
-    # Step 1: Clean each contact
-    cleaned_list = [clean_contact_data(item) for item in raw_data_list]
+    seen = set()
+    valid_list = []
 
-    # Step 2: Remove duplicates
-    unique_list = remove_duplicates(cleaned_list)
+    # Clean, filter and de-duplicate in a single pass over the scraped list
+    for item in raw_data_list:
+        # Step 1: Clean the contact
+        cleaned = clean_contact_data(item)
+
+        # Step 2: Skip entries with no contact information
+        if not (cleaned['email'] or cleaned['phone'] or cleaned['website']):
+            continue
+
+        # Step 3: Skip duplicates (same rule as remove_duplicates)
+        identifier = _dedup_key(cleaned)
+        if identifier is None or identifier in seen:
+            continue
 
-    # Step 3: Filter out entries with no contact information
-    valid_list = [
-        item for item in unique_list
-        if item.get('email') or item.get('phone') or item.get('website')
-    ]
+        seen.add(identifier)
+        valid_list.append(cleaned)
 
     # Step 4: Structure response
     response = structure_response(valid_list, search_term)
@@ -4,42 +4,440 @@ Uses Selenium and BeautifulSoup to scrape publicly available data
 IMPORTANT: Only use on sources that permit scraping. Check robots.txt and ToS.
 """
 
+import atexit
+import os
+import queue
 import re
+import threading
 import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+import diskcache
 import requests
-
-
-def initialize_driver():
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Links on a Google Maps page that are never the business's own website
+_MAPS_EXCLUDED_DOMAINS = ('google.com', 'facebook.com', 'instagram.com', 'twitter.com', 'youtube.com')
+# Google Search result links that are never a business's own website
+_SEARCH_EXCLUDED_DOMAINS = ('google.com', 'youtube.com', 'facebook.com', 'instagram.com',
+                            'twitter.com', 'linkedin.com', 'wikipedia.org', 'maps.google')
+# Each list as one alternation, so a URL is checked in a single regex scan
+_MAPS_EXCLUDED_RE = re.compile('|'.join(map(re.escape, _MAPS_EXCLUDED_DOMAINS)))
+_SEARCH_EXCLUDED_RE = re.compile('|'.join(map(re.escape, _SEARCH_EXCLUDED_DOMAINS)))
+
+# Max concurrent plain-HTTP downloads when prefetching business websites
+_FETCH_WORKERS = 16
+# Max concurrent headless Chrome instances (one per worker thread)
+_SELENIUM_WORKERS = 4
+# Minimum gap between requests to the same host; different sites are not
+# held back by each other
+_HOST_INTERVAL = 1.0  # seconds
+_next_host_hit = {}
+_host_hit_lock = threading.Lock()
+
+# Every driver started by the pool, so they can be quit on interpreter exit
+_live_drivers = set()
+_live_drivers_lock = threading.Lock()
+# Idle WebDrivers kept warm between scrapes (most recently used first); at most
+# _SELENIUM_WORKERS exist at once, idle or busy, across all requests
+_driver_pool = queue.LifoQueue()
+_driver_slots = threading.BoundedSemaphore(_SELENIUM_WORKERS)
+
+# Browser identity sent by both Chrome and the requests session
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Regex patterns compiled once at import instead of on every call
+_PLACE_RE = re.compile(r'/maps/place/')
+_PHONE_IN_RE = re.compile(r'(?:\+91[-\s]?)?[6-9]\d{9}')
+# Every phone format in one alternation, so a text is scanned once
+_PHONE_ANY_RE = re.compile(
+    r'\+91[-.\s]?\d{10}'  # With country code
+    r'|[6-9]\d{2}[-.\s]?\d{3}[-.\s]?\d{4}'  # With separators
+    r'|(?:\+91[-\s]?)?[6-9]\d{9}'  # Indian mobile
+)
+# ASCII mode: only 0-9 count as digits, so phones never keep other-script numerals
+_NON_DIGIT_RE = re.compile(r'\D', re.ASCII)
+_HTTP_PREFIXES = ('http://', 'https://')
+_MAILTO_RE = re.compile(r'mailto:', re.I)
+_MAILTO_EMAIL_RE = re.compile(r'mailto:([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})', re.I | re.ASCII)
+_TEL_RE = re.compile(r'tel:', re.I)
+# Mount points single-page-app frameworks render into (React, Vue, Next.js, Nuxt);
+# left empty in the served HTML, the content only exists after JavaScript runs
+_APP_ROOT_IDS = frozenset(['root', 'app', '__next', '__nuxt'])
+_APP_ROOT_SELECTOR = ', '.join(f'div#{root_id}' for root_id in sorted(_APP_ROOT_IDS))
+# Link href/text words that point at a page likely to list contact details
+_CONTACT_KEYWORD_RE = re.compile(r'contact|about|reach|get-in-touch|connect|support', re.I)
+# '@' written as an HTML entity, as some sites do to hide addresses from bots
+_AT_ENTITY_RE = re.compile(r'&#0*64;|&#x0*40;|&commat;', re.I)
+# Cloudflare email protection replaces addresses in the served HTML with
+# XOR-encoded hex (decoded by its script in the browser), leaving no '@'
+_CF_EMAIL_MARK_RE = re.compile(r'data-cfemail|/cdn-cgi/l/email-protection#', re.I)
+_CF_EMAIL_HREF_PREFIX = '/cdn-cgi/l/email-protection#'
+_EMAIL_SECTION_CLASS_RE = re.compile(r'(contact|footer|email|info|reach)', re.I)
+_PHONE_SECTION_CLASS_RE = re.compile(r'(contact|footer|phone|tel|call)', re.I)
+# Addresses that are placeholders, asset names or third-party services, not the business
+_EXCLUDED_EMAIL_DOMAINS = frozenset({
+    'example.com', 'domain.com', 'email.com', 'test.com', 'wix.com', 'sitelock.com',
+    'schema.org', 'w3.org', 'facebook.com', 'twitter.com', 'instagram.com',
+})
+_EXCLUDED_EMAIL_RE = re.compile(r'placeholder|yoursite|yourdomain|@[23]x\.png|googletagmanager|analytics', re.I)
+_BUSINESS_EMAIL_PREFIXES = ('info', 'contact', 'hello', 'support', 'mail', 'inquiry', 'sales', 'admin')
+# Every repeat is bounded: with open-ended runs a long word without an '@'
+# made each start position rescan to the end, quadratic in the text length
+_OBFUSCATED_EMAIL_RE = re.compile(
+    r'([A-Za-z0-9._%+-]{1,64})\s{0,3}[\[\(]?\s{0,3}@\s{0,3}[\]\)]?\s{0,3}'
+    r'([A-Za-z0-9.-]{1,253})\s{0,3}[\[\(]?\s{0,3}\.\s{0,3}[\]\)]?\s{0,3}([A-Za-z]{2,24})',
+    re.I
+)
+# Bounded quantifiers and \b fencing keep the scan linear on large pages.
+# Emails are ASCII, so \b only needs ASCII word rules (no Unicode lookups,
+# and an address right after a non-ASCII letter is still found)
+_EMAIL_FIND_RE = re.compile(
+    r'\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9-]{1,63}(?:\.[A-Za-z0-9-]{1,63}){0,4}\.[A-Za-z]{2,24}\b',
+    re.ASCII
+)
+
+
+def _build_chrome_options():
     """
-    Sets up Chrome WebDriver with options for headless browsing
+    Builds the Chrome options shared by every WebDriver this module starts
 
     Returns:
-        WebDriver object configured for scraping
+        Options object configured for headless scraping
     """
     chrome_options = Options()
     chrome_options.add_argument('--headless')
     chrome_options.add_argument('--no-sandbox')
     chrome_options.add_argument('--disable-dev-shm-usage')
     chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-    chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    chrome_options.add_argument('--disable-gpu')
+    # driver.get returns at DOMContentLoaded instead of waiting on every ad and
+    # tracker; callers wait explicitly for the content they need
+    chrome_options.page_load_strategy = 'eager'
+    # Images are never inspected - skip downloading and decoding them
+    # (fonts and media are blocked over CDP, see _BLOCKED_RESOURCE_URLS)
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+    })
+    # No translate bar prompts, and no back/forward cache keeping old pages
+    # alive in a browser that is reused across sites
+    chrome_options.add_argument('--disable-features=Translate,BackForwardCache')
+    chrome_options.add_argument(f'user-agent={_USER_AGENT}')
+    return chrome_options
+
+
+# Built once at import; webdriver.Chrome only reads it
+_CHROME_OPTIONS = _build_chrome_options()
+
+# chromedriver binary to use; when unset, Selenium Manager finds (and version-
+# matches to the installed Chrome) one per driver. Only an explicit path is
+# trusted - a stale chromedriver on PATH would fail to start newer Chrome.
+_CHROMEDRIVER_PATH = os.environ.get('CHROMEDRIVER_PATH')
+
+# Heavy resources blocked over CDP - contact details live in the HTML and
+# inline scripts. Stylesheets stay: the Maps feed only scrolls with its layout.
+_BLOCKED_RESOURCE_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm', '*.mp3',
+]
+
+# CSS selector / parse filter for business result links in the Google Maps feed
+_PLACE_LINK_SELECTOR = 'a[href*="/maps/place/"]'
+_FEED_PLACE_LINK_SELECTOR = 'div[role="feed"] ' + _PLACE_LINK_SELECTOR
+_PLACE_LINK_STRAINER = SoupStrainer('a', href=_PLACE_RE)
+
+# Returns [name, phone text, website hrefs] for a Maps place page in one round trip
+_MAPS_FIELDS_SCRIPT = """
+const h1 = document.querySelector('h1');
+const phoneBits = [];
+document.querySelectorAll('[data-item-id^="phone:"], [aria-label]').forEach(el => {
+    phoneBits.push(el.getAttribute('data-item-id') || '', el.getAttribute('aria-label') || '');
+});
+phoneBits.push(document.body ? document.body.innerText : '');
+const hrefs = [];
+const authority = document.querySelector('a[data-item-id="authority"]');
+if (authority) hrefs.push(authority.getAttribute('href'));
+document.querySelectorAll('a[href]').forEach(a => hrefs.push(a.getAttribute('href')));
+return [h1 ? h1.textContent : null, phoneBits.join(' '), hrefs];
+"""
+
+# Scrolls the Maps feed until it stops growing (two still checks in a row),
+# holds arguments[1] place links, or has scrolled 10 times
+_MAPS_SCROLL_SCRIPT = """
+const [linkSelector, wanted, done] = arguments;
+const feed = document.querySelector('div[role="feed"]');
+if (!feed) { done(); return; }
+let lastHeight = -1, still = 0, rounds = 0;
+(function step() {
+    feed.scrollTop = feed.scrollHeight;
+    setTimeout(() => {
+        still = feed.scrollHeight === lastHeight ? still + 1 : 0;
+        lastHeight = feed.scrollHeight;
+        if (still >= 2 || ++rounds >= 10 || feed.querySelectorAll(linkSelector).length >= wanted) {
+            done();
+        } else {
+            step();
+        }
+    }, 400);
+})();
+"""
+
+# Serializes a copy of the DOM without scripts and styles, so the bulk of a
+# rendered page never crosses the WebDriver connection
+_RENDERED_HTML_SCRIPT = """
+const root = document.documentElement.cloneNode(true);
+root.querySelectorAll('script, style').forEach(el => el.remove());
+return root.outerHTML;
+"""
+# Raw href of every business link in the Maps feed page
+_PLACE_HREFS_SCRIPT = """
+return Array.from(document.querySelectorAll(arguments[0]), a => a.getAttribute('href'));
+"""
+
+# Shared HTTP session - keeps connections alive so repeat hits on a host
+# (homepage, then contact pages) skip the TCP/TLS handshake.
+# requests already negotiates gzip/deflate and decompresses transparently.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': _USER_AGENT
+})
+# Size the pools for fetch_pages: up to _FETCH_WORKERS threads may hit one
+# host at once (the default of 10 would drop the extra connections), and
+# keep pools for the many distinct business sites a batch touches.
+# Connection errors and transient 5xx answers get two quick retries; a 429
+# is not retried - a rate-limited site should be left alone, not hammered.
+# Read timeouts are not retried either: a site that stalled once will stall
+# again, and each retry would cost another full read timeout.
+# Retry-After is ignored: urllib3 would otherwise retry any answer carrying
+# it (429 included) and sleep for as long as the site asks, holding a worker.
+_HTTP_RETRY = Retry(total=2, read=0, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504),
+                    raise_on_status=False, respect_retry_after_header=False)
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=20, pool_maxsize=_FETCH_WORKERS, max_retries=_HTTP_RETRY)
+_SESSION.mount('https://', _HTTP_ADAPTER)
+_SESSION.mount('http://', _HTTP_ADAPTER)
+# (connect, read) seconds - a dead host fails fast, a slow page still gets time
+_HTTP_TIMEOUT = (3.05, 10)
+# Downloads stop here; contact details sit near the top or in the footer of
+# ordinary pages, and this keeps multi-MB pages out of memory
+_MAX_PAGE_BYTES = 2 * 1024 * 1024
+# Links the streamed download watches for (raw bytes, before decoding): an
+# <a href> that is a mailto: with an address, or a tel: with at least 10 digits
+_MAILTO_HREF_BYTES_RE = re.compile(
+    rb'<a\s[^>]{0,512}?\bhref\s*=\s*["\']?mailto:[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}', re.I
+)
+# (an unquoted href ends at the first space, so its digits may not span one)
+_TEL_HREF_BYTES_RE = re.compile(
+    rb'<a\s[^>]{0,512}?\bhref\s*=\s*'
+    rb'(?:["\']tel:(?:[^"\'<>0-9]{0,20}[0-9]){10}|tel:(?:[^"\'<>\s0-9]{0,20}[0-9]){10})', re.I
+)
+# End of the <a> start tag - a link only counts once all of it has arrived
+# (the parser drops a start tag still open where the download stops)
+_TAG_END_BYTES_RE = re.compile(rb'>')
+# Markup whose contents the contact parser ignores (script/style/noscript, comments)
+_SKIPPED_MARKUP_BYTES_RE = re.compile(rb'<(/?)(script|style|noscript)\b|<!--|-->', re.I)
+# How far back each chunk re-scans, so a link split across chunks is still matched
+_LINK_SCAN_OVERLAP = 2048
+
+# On-disk copy of fetched pages with their ETag/Last-Modified validators,
+# so a re-scrape of an unchanged page costs a 304 instead of the full body
+_HTTP_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.httpcache')
+_HTTP_CACHE_EXPIRE = 7 * 24 * 3600  # seconds
+_http_cache = diskcache.Cache(_HTTP_CACHE_DIR, size_limit=256 * 1024 * 1024)
+
+# Finished scrape results keyed by ('maps' | 'site' | 'fast', url), so re-running
+# a search reuses them instead of opening the same pages in Chrome again.
+# Sites where nothing was found are kept briefly, so dead ends aren't re-hammered
+# but do get another chance. SCRAPER_NOCACHE=1 starts every run from scratch.
+_SCRAPE_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.scrapecache')
+_SCRAPE_CACHE_EXPIRE = 24 * 3600  # seconds
+_SCRAPE_CACHE_NEGATIVE_EXPIRE = 3600  # seconds
+_scrape_cache = diskcache.Cache(_SCRAPE_CACHE_DIR)
+if os.environ.get('SCRAPER_NOCACHE'):
+    _scrape_cache.clear()
+
+
+def initialize_driver():
+    """
+    Sets up Chrome WebDriver with options for headless browsing
 
+    Returns:
+        WebDriver object configured for scraping
+    """
     try:
-        driver = webdriver.Chrome(options=chrome_options)
+        # A fresh Service per driver (each owns one chromedriver process)
+        service = Service(executable_path=_CHROMEDRIVER_PATH) if _CHROMEDRIVER_PATH else Service()
+        driver = webdriver.Chrome(service=service, options=_CHROME_OPTIONS)
         driver.set_page_load_timeout(30)
+        # Room for the Maps feed scroll loop (10 rounds of 400ms plus slow loads)
+        driver.set_script_timeout(15)
+
+        # Skip images/fonts/media at the network layer, not just when rendering
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_RESOURCE_URLS})
+        except Exception as e:
+            print(f"Could not block page resources: {e}")
+
         return driver
     except Exception as e:
         print(f"Error initializing driver: {e}")
         raise
 
 
+def _wait_for_page_load(driver, timeout=10):
+    """
+    Waits until the current document has rendered some visible text instead of sleeping a fixed time
+
+    Parameters:
+        driver: WebDriver instance
+        timeout (int): Maximum seconds to wait
+
+    Returns:
+        None (a slow page is scraped as-is once the timeout passes)
+    """
+    try:
+        # With the eager load strategy the DOM is parsed already; JavaScript-rendered
+        # sites are ready once their script has put text in the body and filled
+        # any app mount point (the static header around one already has text)
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            lambda d: d.execute_script(
+                "return document.readyState !== 'loading' && "
+                "!!document.body && document.body.innerText.trim().length > 0 && "
+                "!Array.from(document.querySelectorAll(arguments[0])).some("
+                "function (root) { return root.children.length === 0 && !root.textContent.trim(); })",
+                _APP_ROOT_SELECTOR
+            )
+        )
+    except TimeoutException:
+        pass
+
+
+def _rendered_html(driver):
+    """
+    Gets the rendered page's HTML without its <script>/<style> elements, which
+    the contact extraction skips anyway but which make up most of a modern
+    page's markup (bundles, inline JSON state, CSS-in-JS)
+
+    Parameters:
+        driver: WebDriver instance on the page
+
+    Returns:
+        HTML string (the full driver.page_source if the script fails)
+    """
+    try:
+        html = driver.execute_script(_RENDERED_HTML_SCRIPT)
+        if isinstance(html, str) and html:
+            return html
+    except Exception:
+        pass
+    return driver.page_source
+
+
+@atexit.register
+def _quit_live_drivers():
+    """
+    Quits any pooled WebDrivers still running when the interpreter exits
+
+    Returns:
+        None
+    """
+    with _live_drivers_lock:
+        drivers = list(_live_drivers)
+        _live_drivers.clear()
+
+    for driver in drivers:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+def _checkout_driver():
+    """
+    Takes a WebDriver from the shared pool, starting one if a slot is free
+    and otherwise waiting for another scrape to hand one back
+
+    Returns:
+        WebDriver object (give it back with _release_driver)
+    """
+    while True:
+        try:
+            driver = _driver_pool.get_nowait()
+        except queue.Empty:
+            if _driver_slots.acquire(blocking=False):
+                try:
+                    driver = initialize_driver()
+                except Exception:
+                    _driver_slots.release()
+                    raise
+                with _live_drivers_lock:
+                    _live_drivers.add(driver)
+                return driver
+            try:
+                driver = _driver_pool.get(timeout=1)
+            except queue.Empty:
+                continue
+
+        # An idle browser may have crashed since it was returned
+        try:
+            driver.current_url
+            return driver
+        except Exception:
+            _discard_driver(driver)
+
+
+def _release_driver(driver):
+    """
+    Resets a WebDriver and returns it to the shared pool
+
+    Parameters:
+        driver: WebDriver from _checkout_driver
+
+    Returns:
+        None
+    """
+    try:
+        # Don't leak cookies or the last page into the next scrape
+        driver.delete_all_cookies()
+        driver.get('about:blank')
+    except Exception:
+        _discard_driver(driver)
+        return
+    _driver_pool.put(driver)
+
+
+def _discard_driver(driver):
+    """
+    Quits a broken WebDriver and frees its pool slot
+
+    Parameters:
+        driver: WebDriver from _checkout_driver
+
+    Returns:
+        None
+    """
+    with _live_drivers_lock:
+        _live_drivers.discard(driver)
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    _driver_slots.release()
+
+
 def search_google_web(search_term):
     """
     Uses Google Search to fetch top 10 website URLs directly
@@ -50,68 +448,104 @@ def search_google_web(search_term):
     Returns:
         List of website URLs from Google Search results
     """
-    driver = None
-    try:
-        driver = initialize_driver()
+    # The same query within a day reuses its result list
+    cache_key = ('search', ' '.join(search_term.lower().split()))
+    cached = _scrape_cache.get(cache_key)
+    if cached is not None:
+        print(f"Using cached Google results for: {search_term}")
+        return cached
 
-        # Construct Google Search URL
-        encoded_term = search_term.replace(' ', '+')
-        search_url = f"https://www.google.com/search?q={encoded_term}"
+    # Construct Google Search URL
+    encoded_term = search_term.replace(' ', '+')
+    search_url = f"https://www.google.com/search?q={encoded_term}"
+
+    print(f"Searching Google for: {search_term}")
+
+    # Plain HTTP first; when Google answers with a page that needs
+    # JavaScript (no result links), render it in the browser instead
+    unique_websites = _search_result_links(fetch_page(search_url) or '')
+    if not unique_websites:
+        unique_websites = _search_google_web_browser(search_url)
+
+    print(f"Found {len(unique_websites)} unique websites from Google Search")
+    if unique_websites:
+        _scrape_cache.set(cache_key, unique_websites, expire=_SCRAPE_CACHE_EXPIRE)
+    return unique_websites
 
-        print(f"Searching Google for: {search_term}")
+
+def _search_google_web_browser(search_url):
+    """
+    Loads a Google Search results page in headless Chrome
+
+    Parameters:
+        search_url (string): Google Search URL
+
+    Returns:
+        List of website URLs from the results
+    """
+    driver = None
+    try:
+        driver = _checkout_driver()
         driver.get(search_url)
-        time.sleep(2)
+        _wait_for_page_load(driver)
 
         # Extract search results
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'lxml')
-
-        # Find all search result links
-        websites = []
-        
-        # Google search results are in <a> tags within divs with specific classes
-        # Look for actual website links (not Google's internal links)
-        search_results = soup.find_all('a', href=True)
-        
-        for result in search_results:
-            href = result.get('href', '')
-            
-            # Extract actual URLs from Google's redirect links
-            if '/url?q=' in href:
-                # Parse the actual URL
-                actual_url = href.split('/url?q=')[1].split('&')[0]
-                
-                # Filter out Google's own links and unwanted domains
-                excluded = ['google.com', 'youtube.com', 'facebook.com', 'instagram.com', 
-                           'twitter.com', 'linkedin.com', 'wikipedia.org', 'maps.google']
-                
-                if actual_url.startswith('http') and not any(ex in actual_url for ex in excluded):
-                    websites.append(actual_url)
-            
-            # Also check for direct links
-            elif href.startswith('http') and '/url?' not in href:
-                excluded = ['google.com', 'youtube.com', 'facebook.com', 'instagram.com',
-                           'twitter.com', 'linkedin.com', 'wikipedia.org', 'maps.google']
-                if not any(ex in href for ex in excluded):
-                    websites.append(href)
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_websites = []
-        for site in websites:
-            if site not in seen and len(unique_websites) < 10:
-                seen.add(site)
-                unique_websites.append(site)
-        
-        print(f"Found {len(unique_websites)} unique websites from Google Search")
-        return unique_websites
+        return _search_result_links(_rendered_html(driver))
 
     except Exception as e:
         print(f"Error searching Google: {e}")
         return []
     finally:
         if driver:
-            driver.quit()
+            _release_driver(driver)
+
+
+def _search_result_links(page_source):
+    """
+    Picks the result websites out of a Google Search results page
+
+    Parameters:
+        page_source (string): HTML of the results page
+
+    Returns:
+        List of up to 10 website URLs, in ranking order
+    """
+    if not page_source:
+        return []
+    soup = BeautifulSoup(page_source, 'lxml')
+
+    # Find all search result links - a dict keeps Google's ranking order
+    # while dropping duplicates, and collection stops at the top 10
+    websites = {}
+    
+    # Google search results are in <a> tags within divs with specific classes
+    # Look for actual website links (not Google's internal links)
+    search_results = soup.find_all('a', href=True)
+    
+    for result in search_results:
+        href = result.get('href', '')
+        website = None
+        
+        # Extract actual URLs from Google's redirect links
+        if '/url?q=' in href:
+            # Parse the actual URL
+            actual_url = href.split('/url?q=')[1].split('&')[0]
+            
+            # Filter out Google's own links and unwanted domains
+            if actual_url.startswith('http') and not _SEARCH_EXCLUDED_RE.search(actual_url):
+                website = actual_url
+        
+        # Also check for direct links
+        elif href.startswith('http') and '/url?' not in href:
+            if not _SEARCH_EXCLUDED_RE.search(href):
+                website = href
+
+        if website:
+            websites[website] = None
+            if len(websites) == 10:
+                break
+    
+    return list(websites)
 
 
 def search_business_directory(search_term):
@@ -126,7 +560,7 @@ def search_business_directory(search_term):
     """
     driver = None
     try:
-        driver = initialize_driver()
+        driver = _checkout_driver()
 
         # Construct Google Maps search URL
         encoded_term = search_term.replace(' ', '+')
@@ -134,42 +568,49 @@ def search_business_directory(search_term):
 
         driver.get(search_url)
 
-        # Wait for results to load
-        time.sleep(3)
+        # Wait for the first results to appear in the feed
+        try:
+            WebDriverWait(driver, 10, poll_frequency=0.2).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, _FEED_PLACE_LINK_SELECTOR))
+            )
+        except TimeoutException:
+            pass
 
-        # Scroll to load more results
-        scrollable_div = driver.find_element(By.CSS_SELECTOR, 'div[role="feed"]')
-        for _ in range(3):
-            driver.execute_script('arguments[0].scrollTop = arguments[0].scrollHeight', scrollable_div)
-            time.sleep(1)
+        # Scroll to load more results - the loop runs inside the page and
+        # returns once the feed stops growing or holds enough links
+        try:
+            driver.execute_async_script(_MAPS_SCROLL_SCRIPT, _PLACE_LINK_SELECTOR, 10)
+        except TimeoutException:
+            pass
 
-        # Extract business links
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'lxml')
+        # Extract business links - ask the browser for just the place hrefs
+        # instead of serializing the whole (huge, script-heavy) Maps page
+        try:
+            hrefs = driver.execute_script(_PLACE_HREFS_SCRIPT, _PLACE_LINK_SELECTOR)
+        except Exception:
+            soup = BeautifulSoup(driver.page_source, 'lxml', parse_only=_PLACE_LINK_STRAINER)
+            hrefs = [result.get('href') for result in soup.find_all('a')]
 
         # Find business links (this is a simplified approach)
-        links = []
-        results = soup.find_all('a', href=re.compile(r'/maps/place/'))
-
-        for result in results[:10]:  # Limit to top 10
-            href = result.get('href')
-            if href and 'https' not in href:
-                full_url = f"https://www.google.com{href}"
-                links.append(full_url)
-            elif href:
-                links.append(href)
-
-        # Remove duplicates
-        unique_links = list(set(links))[:10]
+        # Dedup while collecting so Maps' ranking order is kept
+        unique_links = {}
+        for href in hrefs or []:
+            if not href:
+                continue
+
+            full_url = href if 'https' in href else f"https://www.google.com{href}"
+            unique_links[full_url] = None
+            if len(unique_links) == 10:  # Limit to top 10
+                break
 
-        return unique_links
+        return list(unique_links)
 
     except Exception as e:
         print(f"Error searching business directory: {e}")
         return []
     finally:
         if driver:
-            driver.quit()
+            _release_driver(driver)
 
 
 def scrape_google_maps_page(url):
@@ -182,63 +623,68 @@ def scrape_google_maps_page(url):
     Returns:
         Dictionary with business info from Google Maps
     """
+    cache_key = ('maps', _maps_cache_url(url))
+    cached = _scrape_cache.get(cache_key)
+    if cached is not None:
+        return dict(cached, maps_url=url)
+
+    # All place pages live on Google - space out the ones actually loaded
+    # (before borrowing a browser, so no driver sits idle while waiting)
+    _wait_for_host(url)
+
     driver = None
     try:
-        driver = initialize_driver()
+        driver = _checkout_driver()
         driver.get(url)
 
-        # Wait for page to load
-        time.sleep(3)
+        # Wait for the business name to render
+        try:
+            WebDriverWait(driver, 10, poll_frequency=0.2).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'h1'))
+            )
+        except TimeoutException:
+            pass
 
-        # Get page source
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'lxml')
+        # Maps pages are huge - read just the fields we need inside the browser
+        # instead of copying the whole page source out and parsing it
+        name_text, phone_text, website_hrefs = driver.execute_script(_MAPS_FIELDS_SCRIPT)
 
         # Extract business name
         business_name = None
         try:
-            name_element = soup.find('h1')
-            if name_element:
-                business_name = name_element.get_text(strip=True)
+            if name_text:
+                business_name = ' '.join(name_text.split()) or None
         except:
             pass
 
         # Extract phone from Google Maps
         phone = None
         try:
-            # Look for phone patterns in buttons or divs with aria-label
-            phone_pattern = r'(\+91[-\s]?)?[6-9]\d{9}'
-            phones = re.findall(phone_pattern, page_source)
-            if phones:
-                phone = phones[0] if isinstance(phones[0], str) else ''.join(phones[0])
+            # Look for phone patterns in phone buttons, aria-labels and visible text
+            phone_match = _PHONE_IN_RE.search(phone_text or '')
+            if phone_match:
+                phone = phone_match.group(0)
         except:
             pass
 
         # Extract website URL from Google Maps
         website = None
         try:
-            # Look for website link (usually has data-item-id="authority" or similar)
-            website_links = soup.find_all('a', href=True)
-            for link in website_links:
-                href = link.get('href', '')
-                # Filter out Google/social media links
-                if (href.startswith('http') and 
-                    'google.com' not in href and 
-                    'facebook.com' not in href and 
-                    'instagram.com' not in href and
-                    'twitter.com' not in href and
-                    'youtube.com' not in href):
-                    website = href
-                    break
+            # The website link usually has data-item-id="authority" and comes first;
+            # stop at the first href that looks like a business site
+            website = next((href for href in website_hrefs or [] if _is_business_website(href)), None)
         except:
             pass
 
-        return {
+        maps_data = {
             'business_name': business_name,
             'phone': phone,
             'website': website,
             'maps_url': url
         }
+        if business_name or website:
+            _scrape_cache.set(cache_key, maps_data, expire=_SCRAPE_CACHE_EXPIRE)
+        return maps_data
 
     except Exception as e:
         print(f"Error scraping Google Maps page {url}: {e}")
@@ -250,7 +696,211 @@ def scrape_google_maps_page(url):
         }
     finally:
         if driver:
-            driver.quit()
+            _release_driver(driver)
+
+
+def _maps_cache_url(url):
+    """
+    Drops the query string and fragment of a Maps place URL (authuser, hl,
+    click tracking...), which change between searches for the same place
+
+    Parameters:
+        url (string): Google Maps URL
+
+    Returns:
+        URL string used as the cache key
+    """
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+
+
+def fetch_page(url):
+    """
+    Downloads a page's raw HTML using requests (no browser needed)
+
+    Parameters:
+        url (string): Page to download
+
+    Returns:
+        HTML string, or None if the request failed
+    """
+    try:
+        # Revalidate a previously seen page instead of downloading it again
+        cached = _http_cache.get(url)
+        headers = {}
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        _wait_for_host(url)
+        response = _SESSION.get(url, headers=headers, timeout=_HTTP_TIMEOUT, stream=True)
+        if response.status_code == 304 and cached:
+            response.close()
+            return cached['body']
+
+        response.raise_for_status()
+        page_source, complete = _read_body(response)
+
+        # Only a complete body is worth revalidating later
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if complete and (etag or last_modified):
+            _http_cache.set(url, {
+                'etag': etag,
+                'last_modified': last_modified,
+                'body': page_source
+            }, expire=_HTTP_CACHE_EXPIRE)
+
+        return page_source
+
+    except Exception as e:
+        print(f"    Requests scraping failed: {e}")
+        return None
+
+
+def _read_body(response):
+    """
+    Reads a streamed response, stopping as soon as both a mailto: and a tel:
+    link have gone by (those decide the email and phone found on the page),
+    or once _MAX_PAGE_BYTES have arrived
+
+    Parameters:
+        response: requests Response opened with stream=True
+
+    Returns:
+        Tuple of (HTML string, whether the whole body was read)
+    """
+    body = bytearray()
+    seen_mailto = seen_tel = False
+    mailto_from = tel_from = 0
+    mailto_markup = _SkippedMarkupState()
+    tel_markup = _SkippedMarkupState()
+    complete = True
+    try:
+        for chunk in response.iter_content(chunk_size=16384):
+            body += chunk
+            if not seen_mailto:
+                seen_mailto, mailto_from = _find_complete_link(
+                    _MAILTO_HREF_BYTES_RE, body, mailto_from, mailto_markup)
+            if not seen_tel:
+                seen_tel, tel_from = _find_complete_link(
+                    _TEL_HREF_BYTES_RE, body, tel_from, tel_markup)
+            if (seen_mailto and seen_tel) or len(body) >= _MAX_PAGE_BYTES:
+                complete = False
+                break
+    finally:
+        response.close()
+
+    # Decode the way response.text would
+    encoding = response.encoding or requests.compat.chardet.detect(bytes(body))['encoding'] or 'utf-8'
+    try:
+        return str(body, encoding, errors='replace'), complete
+    except LookupError:
+        return str(body, 'utf-8', errors='replace'), complete
+
+
+def _find_complete_link(pattern, body, start, markup):
+    """
+    Looks for a whole, parser-visible link in the downloaded part of a page
+
+    Parameters:
+        pattern: One of the *_HREF_BYTES_RE patterns
+        body (bytearray): Bytes received so far
+        start (int): Offset to scan from
+        markup (_SkippedMarkupState): Skipped-markup tracker kept for this pattern
+
+    Returns:
+        Tuple of (whether a link was found, offset to scan from after the next chunk)
+    """
+    resume_from = max(start, len(body) - _LINK_SCAN_OVERLAP)
+    for match in pattern.finditer(body, start):
+        if _TAG_END_BYTES_RE.search(body, match.end()) is None:
+            # The href is still arriving - look at it again with the next chunk
+            return False, match.start()
+        if not markup.covers(body, match.start()):
+            return True, len(body)
+        # Links already ruled out are not scanned again, so the markup
+        # tracker only ever moves forward
+        resume_from = max(resume_from, match.end())
+    return False, resume_from
+
+
+class _SkippedMarkupState:
+    """
+    Tracks whether a byte offset falls inside a <script>, <style> or <noscript>
+    element or an HTML comment, where the contact parser reads no links.
+    Offsets are checked in increasing order and scanning picks up where the
+    last check stopped, so each byte of the page is read once.
+    """
+
+    def __init__(self):
+        self.scanned_to = 0
+        self.raw_tag = None
+        self.in_comment = False
+
+    def covers(self, body, pos):
+        """
+        Parameters:
+            body (bytearray): Bytes received so far
+            pos (int): Offset to check (the start of an <a> tag)
+
+        Returns:
+            Boolean
+        """
+        if pos < self.scanned_to:
+            # Only reached if offsets come out of order - start over
+            self.scanned_to = 0
+            self.raw_tag = None
+            self.in_comment = False
+        for token in _SKIPPED_MARKUP_BYTES_RE.finditer(body, self.scanned_to, pos):
+            if self.in_comment:
+                self.in_comment = token.group(0) != b'-->'
+            elif self.raw_tag:
+                if token.group(1) and token.group(2).lower() == self.raw_tag:
+                    self.raw_tag = None
+            elif token.group(0) == b'<!--':
+                self.in_comment = True
+            elif token.group(2) and not token.group(1):
+                self.raw_tag = token.group(2).lower()
+        # pos is the '<' of a tag, so no token can straddle it
+        self.scanned_to = pos
+        return self.in_comment or self.raw_tag is not None
+
+
+def fetch_pages(urls):
+    """
+    Downloads several pages concurrently so network waits overlap
+
+    Parameters:
+        urls (list): Page URLs to download (None entries and duplicates are skipped)
+
+    Returns:
+        Dictionary mapping each URL to its HTML ('' if the request failed)
+    """
+    unique_urls = list(dict.fromkeys(url for url in urls if url))
+    if not unique_urls:
+        return {}
+
+    workers = min(_FETCH_WORKERS, len(unique_urls))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pages = executor.map(fetch_page, unique_urls)
+        return {url: page or '' for url, page in zip(unique_urls, pages)}
+
+
+def _is_business_website(href):
+    """
+    Checks whether a Google Maps link points at the business's own website
+
+    Parameters:
+        href (string): Link target
+
+    Returns:
+        Boolean (True for absolute links outside Google/social media)
+    """
+    # Filter out Google/social media links
+    return bool(href) and href.startswith(_HTTP_PREFIXES) and not _MAPS_EXCLUDED_RE.search(href)
 
 
 def scrape_with_requests(url):
@@ -263,52 +913,113 @@ def scrape_with_requests(url):
     Returns:
         Dictionary with email and phone
     """
+    cached = _scrape_cache.get(('fast', url))
+    if cached is not None:
+        return dict(cached)
+
+    page_source = fetch_page(url)
+    if page_source is None:
+        return {'email': None, 'phone': None}
+
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'lxml')
-        return extract_contact_info_from_website(response.text, soup)
+        contact_info = extract_contact_info_from_website(page_source)
     
     except Exception as e:
         print(f"    Requests scraping failed: {e}")
         return {'email': None, 'phone': None}
 
+    _scrape_cache.set(('fast', url), contact_info, expire=_scrape_cache_expire(contact_info))
+    return contact_info
+
+
+def _scrape_cache_expire(contact_info):
+    """
+    Picks how long a website result stays cached
+
+    Parameters:
+        contact_info (dictionary): Scrape result with email/phone
+
+    Returns:
+        Seconds (a day when something was found, an hour otherwise)
+    """
+    if contact_info.get('email') or contact_info.get('phone'):
+        return _SCRAPE_CACHE_EXPIRE
+    return _SCRAPE_CACHE_NEGATIVE_EXPIRE
 
-def scrape_single_page(url, driver=None):
+
+def scrape_single_page(url, page_source=None):
     """
     Opens business website URL with Selenium and scrapes for contact info
+    (a browser is borrowed from the pool only if the page needs one)
 
     Parameters:
         url (string): Business website to scrape
-        driver: Optional existing WebDriver instance
+        page_source (string): Optional HTML already downloaded for url
+                              ('' means the download failed)
+
+    Returns:
+        Dictionary with email and additional contact details
+    """
+    # A site scraped recently skips the download, parse and browser entirely
+    cached = _scrape_cache.get(('site', url))
+    if cached is not None:
+        print(f"  Using cached contact info for: {url}")
+        return dict(cached)
+
+    contact_info = _scrape_website(url, page_source)
+    _scrape_cache.set(('site', url), contact_info, expire=_scrape_cache_expire(contact_info))
+    return contact_info
+
+
+def _scrape_website(url, page_source):
+    """
+    Does the actual scraping for scrape_single_page (see there for parameters)
 
     Returns:
         Dictionary with email and additional contact details
     """
-    # Try fast method first (requests)
-    print(f"  Trying fast scraping for: {url}")
-    fast_result = scrape_with_requests(url)
+    # Try fast method first (requests), reusing a prefetched download if given
+    if page_source is None:
+        print(f"  Trying fast scraping for: {url}")
+        page_source = fetch_page(url) or ''
+
+    # One parse serves the contact extraction, the JavaScript-shell check
+    # and contact page discovery
+    parts = None
+    if page_source:
+        try:
+            parts = _parse_contact_parts(page_source)
+        except Exception as e:
+            print(f"    Fast parse failed: {e}")
+
+    fast_result = {'email': None, 'phone': None}
+    if page_source:
+        try:
+            fast_result = extract_contact_info_from_website(parts if parts is not None else page_source)
+        except Exception as e:
+            print(f"    Requests scraping failed: {e}")
     
     if fast_result.get('email'):
         print(f"  ✓ Email found with fast method: {fast_result['email']}")
         fast_result['website'] = url
         return fast_result
+
+    # A static page the browser would render the same way - follow its
+    # contact pages over plain HTTP instead of starting Chrome
+    browser_reason = _needs_browser(parts) if parts is not None else 'not reachable over HTTP'
+    if not browser_reason:
+        print(f"  No email from fast method, static page - checking contact pages over HTTP...")
+        return _scrape_contact_pages(url, parts, fast_result)
     
-    # If fast method didn't find email, use Selenium for dynamic content
-    print(f"  No email from fast method, using browser...")
-    
-    close_driver = False
-    if driver is None:
-        driver = initialize_driver()
-        close_driver = True
+    # Unreachable over plain HTTP or rendered by JavaScript - use Selenium
+    print(f"  No email from fast method, using browser ({browser_reason})...")
     
+    driver = None
     try:
+        _wait_for_host(url)
+        driver = _checkout_driver()
         driver.get(url)
-        time.sleep(3)
+        _wait_for_page_load(driver)
         
         # Scroll down to load lazy content
         try:
@@ -317,60 +1028,8 @@ def scrape_single_page(url, driver=None):
         except:
             pass
         
-        # Get page source after JavaScript rendering
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'lxml')
-
-        # Extract contact info from main page
-        contact_info = extract_contact_info_from_website(page_source, soup)
-        
-        if contact_info.get('email'):
-            print(f"  ✓ Email found on homepage: {contact_info['email']}")
-        
-        # If no email found, try to find and visit contact/about pages
-        if not contact_info.get('email'):
-            print(f"  No email on homepage, searching for contact pages...")
-            contact_pages = find_contact_pages(soup, url)
-            
-            if contact_pages:
-                print(f"  Found {len(contact_pages)} potential contact pages")
-            
-            for idx, contact_url in enumerate(contact_pages[:2], 1):  # Try first 2 contact pages
-                try:
-                    print(f"    [{idx}] Checking: {contact_url}")
-                    driver.get(contact_url)
-                    time.sleep(2)
-                    
-                    # Scroll contact page too
-                    try:
-                        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(0.5)
-                    except:
-                        pass
-                    
-                    contact_page_source = driver.page_source
-                    contact_soup = BeautifulSoup(contact_page_source, 'lxml')
-                    additional_info = extract_contact_info_from_website(contact_page_source, contact_soup)
-                    
-                    if additional_info.get('email'):
-                        contact_info['email'] = additional_info['email']
-                        print(f"    ✓ Email found on contact page: {additional_info['email']}")
-                        break
-                    else:
-                        print(f"    ✗ No email found on this page")
-                    
-                    if additional_info.get('phone') and not contact_info.get('phone'):
-                        contact_info['phone'] = additional_info['phone']
-                except Exception as e:
-                    print(f"    Error checking contact page: {e}")
-                    continue
-        
-        if not contact_info.get('email'):
-            print(f"  ✗ No email found anywhere on {url}")
-
-        contact_info['website'] = url
-        return contact_info
-
+        # Page after JavaScript rendering
+        page = _rendered_html(driver)
     except Exception as e:
         print(f"Error scraping website {url}: {e}")
         return {
@@ -379,194 +1038,499 @@ def scrape_single_page(url, driver=None):
             'website': url
         }
     finally:
-        if close_driver and driver:
-            driver.quit()
+        # Back in the pool before any contact page is downloaded or waited on
+        if driver:
+            _release_driver(driver)
+
+    # The parse is reused for contact page discovery
+    try:
+        page = _parse_contact_parts(page)
+    except Exception as e:
+        print(f"    Fast parse failed: {e}")
+
+    # Extract contact info from main page
+    contact_info = extract_contact_info_from_website(page)
+    
+    if contact_info.get('email'):
+        print(f"  ✓ Email found on homepage: {contact_info['email']}")
+        contact_info['website'] = url
+        return contact_info
+
+    # Contact pages are often static even on a JavaScript-built site; any
+    # that could not be downloaded are rendered as well, like the homepage
+    print(f"  No email on homepage, searching for contact pages...")
+    return _scrape_contact_pages(url, page, contact_info, render_failed=True)
+
+
+def _needs_browser(parts):
+    """
+    Decides whether a page fetched over plain HTTP is a JavaScript shell
+
+    Parameters:
+        parts: _ContactPartsTarget parts of the fetched page
+
+    Returns:
+        Reason string when the page needs rendering (no visible body text, or
+        an empty single-page-app mount point), otherwise None
+    """
+    if not parts.has_body_text:
+        return 'no visible text'
+    # Header/footer text around an app that fills itself in on the client
+    if parts.empty_app_root:
+        return 'empty app root'
+    return None
 
 
-def find_contact_pages(soup, base_url):
+def _scrape_contact_pages(url, parts, contact_info, render_failed=False):
+    """
+    Checks a site's contact/about pages with plain HTTP requests,
+    rendering only the ones that turn out to be JavaScript shells
+
+    Parameters:
+        url (string): Business website homepage
+        parts: _ContactPartsTarget parts of the homepage (or its HTML string)
+        contact_info (dictionary): Contact details found on the homepage so far
+        render_failed (bool): Also render pages whose download failed (for
+                    sites whose homepage could only be loaded in the browser)
+
+    Returns:
+        Dictionary with email and additional contact details
+    """
+    contact_pages = find_contact_pages(parts, url)[:2]  # Try first 2 contact pages
+    if contact_pages:
+        print(f"  Found {len(contact_pages)} potential contact pages")
+
+    # Download the candidates together, then check them in link order
+    pages = fetch_pages(contact_pages)
+    for idx, contact_url in enumerate(contact_pages, 1):
+        try:
+            print(f"    [{idx}] Checking: {contact_url}")
+            page_source = pages.get(contact_url)
+            if page_source:
+                contact_source = _parse_contact_parts(page_source)
+                if _needs_browser(contact_source):
+                    contact_source = _render_contact_page(contact_url)
+            elif render_failed:
+                contact_source = _render_contact_page(contact_url)
+            else:
+                continue
+
+            additional_info = extract_contact_info_from_website(contact_source)
+            if additional_info.get('email'):
+                contact_info['email'] = additional_info['email']
+                print(f"    ✓ Email found on contact page: {additional_info['email']}")
+                break
+            else:
+                print(f"    ✗ No email found on this page")
+
+            if additional_info.get('phone') and not contact_info.get('phone'):
+                contact_info['phone'] = additional_info['phone']
+        except Exception as e:
+            print(f"    Error checking contact page: {e}")
+            continue
+
+    if not contact_info.get('email'):
+        print(f"  ✗ No email found anywhere on {url}")
+
+    contact_info['website'] = url
+    return contact_info
+
+
+def _render_contact_page(contact_url):
+    """
+    Loads a contact page in a pooled browser and returns its rendered HTML.
+    The host wait comes before a driver is borrowed, and the driver goes back
+    as soon as the HTML is read, so no browser sits idle through a wait.
+
+    Parameters:
+        contact_url (string): Page to load
+
+    Returns:
+        HTML string of the rendered page
+    """
+    _wait_for_host(contact_url)
+    driver = _checkout_driver()
+    try:
+        driver.get(contact_url)
+        _wait_for_page_load(driver)
+
+        # Scroll contact page too
+        try:
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            time.sleep(0.5)
+        except:
+            pass
+
+        return _rendered_html(driver)
+    finally:
+        _release_driver(driver)
+
+
+def find_contact_pages(page, base_url):
     """
     Finds links to contact, about, or other pages that might contain email
 
     Parameters:
-        soup: BeautifulSoup object
+        page: HTML string of the page, or its _ContactPartsTarget parts
         base_url: Base URL of the website
 
     Returns:
         List of URLs to check
     """
-    contact_pages = []
-    contact_keywords = ['contact', 'about', 'reach', 'get-in-touch', 'connect', 'support']
+    # Ordered and deduplicated: a dict keeps the first occurrence of each URL
+    contact_pages = {}
     
     try:
         # Parse base URL to get domain
         base_domain = urlparse(base_url).netloc
         
-        # Find all links
-        links = soup.find_all('a', href=True)
+        # Find all links as (href, text) pairs
+        if isinstance(page, str):
+            page = _parse_contact_parts(page)
+        links = page.links
         
-        for link in links:
-            href = link.get('href', '').lower()
-            text = link.get_text(strip=True).lower()
-            
+        for raw_href, text in links:
             # Check if link text or href contains contact keywords
-            if any(keyword in href or keyword in text for keyword in contact_keywords):
+            if _CONTACT_KEYWORD_RE.search(raw_href) or _CONTACT_KEYWORD_RE.search(text):
                 # Convert relative URLs to absolute
-                full_url = urljoin(base_url, link['href'])
+                full_url = urljoin(base_url, raw_href)
                 
                 # Only include URLs from same domain
                 if urlparse(full_url).netloc == base_domain:
-                    contact_pages.append(full_url)
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_pages = []
-        for page in contact_pages:
-            if page not in seen:
-                seen.add(page)
-                unique_pages.append(page)
+                    contact_pages[full_url] = None
+                    if len(contact_pages) == 3:  # Return max 3 contact pages
+                        break
         
-        return unique_pages[:3]  # Return max 3 contact pages
+        return list(contact_pages)
     
     except Exception as e:
         print(f"    Error finding contact pages: {e}")
         return []
 
 
-def extract_contact_info_from_website(page_source, soup=None):
+def _is_excluded_email(email):
     """
-    Enhanced extraction - Uses multiple methods to find emails and phones
+    Checks an email against the placeholder/third-party exclusions
 
     Parameters:
-        page_source (string): HTML content of business website
-        soup: BeautifulSoup object (optional, will create if not provided)
+        email (string): Candidate email address
 
     Returns:
-        Dictionary with contact details
+        Boolean (True if the email should be skipped)
     """
-    if soup is None:
-        soup = BeautifulSoup(page_source, 'lxml')
+    # Set lookups on the domain and its parents (mail.example.com -> example.com),
+    # so look-alikes such as contest.com are no longer caught by 'test.com'
+    labels = email.rpartition('@')[2].lower().split('.')
+    for i in range(len(labels) - 1):
+        if '.'.join(labels[i:]) in _EXCLUDED_EMAIL_DOMAINS:
+            return True
+    return _EXCLUDED_EMAIL_RE.search(email) is not None
 
-    email = None
-    phone = None
 
-    # Method 1: Look for mailto: links (most reliable)
-    try:
-        mailto_links = soup.find_all('a', href=re.compile(r'mailto:', re.I))
-        for link in mailto_links:
-            href = link.get('href', '')
-            email_match = re.search(r'mailto:([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})', href, re.I)
-            if email_match:
-                email = email_match.group(1).lower()
+def _pick_best_email(page_text, section_spans):
+    """
+    Picks the most business-like email from a single pass over the page text
+
+    Parameters:
+        page_text (string): Visible text of the page
+        section_spans (list): Sorted (start, end) offsets of footer/contact section text
+
+    Returns:
+        Email string, or None if no acceptable email was found
+    """
+    span_starts = [start for start, _ in section_spans]
+    best_email = None
+    best_score = -1
+
+    for match in _EMAIL_FIND_RE.finditer(page_text):
+        candidate = match.group(0).lower()
+
+        # Filter out common non-business emails
+        if _is_excluded_email(candidate):
+            continue
+
+        # Emails in a footer/contact section rank first, then common business prefixes
+        idx = bisect_right(span_starts, match.start()) - 1
+        in_section = idx >= 0 and match.start() < section_spans[idx][1]
+        score = (2 if in_section else 0) + (1 if any(prefix in candidate for prefix in _BUSINESS_EMAIL_PREFIXES) else 0)
+
+        # Earliest match wins ties; nothing can beat a prefixed email in a contact section
+        if score > best_score:
+            best_email, best_score = candidate, score
+            if score == 3:
                 break
-    except:
-        pass
 
-    # Method 2: Look for emails in specific HTML attributes
-    if not email:
-        try:
-            # Check data attributes, aria-labels, etc.
-            elements_with_email = soup.find_all(attrs={'data-email': True})
-            for elem in elements_with_email:
-                potential_email = elem.get('data-email', '')
-                if '@' in potential_email and '.' in potential_email:
-                    email = potential_email.lower()
-                    break
-        except:
-            pass
+    return best_email
 
-    # Method 3: Look in specific elements (footer, contact sections)
-    if not email:
-        try:
-            # Check footer, contact divs, headers, etc.
-            contact_sections = soup.find_all(['footer', 'div', 'section', 'header'], 
-                                            class_=re.compile(r'(contact|footer|email|info|reach)', re.I))
-            for section in contact_sections:
-                section_text = section.get_text()
-                email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                emails = re.findall(email_pattern, section_text, re.I)
-                
-                # Filter out common non-business emails
-                excluded_patterns = ['example.com', 'domain.com', 'email.com', 'test.com', 'wix.com', 
-                                   'sitelock.com', 'placeholder', 'yoursite', 'yourdomain']
-                valid_emails = [e for e in emails if not any(pattern in e.lower() for pattern in excluded_patterns)]
-                
-                if valid_emails:
-                    email = valid_emails[0].lower()
-                    break
-        except:
-            pass
 
-    # Method 4: Look for obfuscated emails (e.g., "info [at] company [dot] com")
-    if not email:
-        try:
-            obfuscated_pattern = r'([A-Za-z0-9._%+-]+)\s*[\[\(]?\s*@\s*[\]\)]?\s*([A-Za-z0-9.-]+)\s*[\[\(]?\s*\.\s*[\]\)]?\s*([A-Za-z]{2,})'
-            matches = re.findall(obfuscated_pattern, page_source, re.I)
-            if matches:
-                email = f"{matches[0][0]}@{matches[0][1]}.{matches[0][2]}".lower()
-        except:
-            pass
+def _find_obfuscated_email(page_text):
+    """
+    Looks for emails written to dodge scrapers (e.g., "info [@] company [.] com")
 
-    # Method 5: General page source regex search with better filtering
-    if not email:
-        try:
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            emails = re.findall(email_pattern, page_source, re.I)
-            
-            # More comprehensive filtering
-            excluded_patterns = ['example.com', 'domain.com', 'email.com', 'test.com', 'wix.com', 
-                               'sitelock.com', 'schema.org', 'w3.org', 'placeholder', '@2x.png', '@3x.png',
-                               'googletagmanager', 'analytics', 'facebook.com', 'twitter.com', 'instagram.com']
-            valid_emails = [e for e in emails if not any(pattern in e.lower() for pattern in excluded_patterns)]
-            
-            # Prefer emails with common business prefixes
-            business_prefixes = ['info', 'contact', 'hello', 'support', 'mail', 'inquiry', 'sales', 'admin']
-            for e in valid_emails:
-                if any(prefix in e.lower() for prefix in business_prefixes):
-                    email = e.lower()
-                    break
-            
-            # If no business prefix, take first valid email
-            if not email and valid_emails:
-                email = valid_emails[0].lower()
-        except:
-            pass
+    Parameters:
+        page_text (string): Visible text of the page
+
+    Returns:
+        Email string, or None if no acceptable email was found
+    """
+    for match in _OBFUSCATED_EMAIL_RE.finditer(page_text):
+        candidate = f"{match.group(1)}@{match.group(2)}.{match.group(3)}".lower()
+        if not _is_excluded_email(candidate):
+            return candidate
+    return None
+
+
+def _find_phone(search_text):
+    """
+    Finds the first phone number in a block of text
+
+    Parameters:
+        search_text (string): Text to search
+
+    Returns:
+        Phone digits string, or None if no pattern matched
+    """
+    for phone_match in _PHONE_ANY_RE.finditer(search_text):
+        phone = _NON_DIGIT_RE.sub('', phone_match.group(0))
+        if len(phone) >= 10:
+            return phone
+    return None
 
-    # Extract phone number using multiple methods
+
+def _decode_cf_email(encoded):
+    """
+    Decodes an address hidden by Cloudflare email protection: hex bytes where
+    the first is a key XORed into each of the others
+
+    Parameters:
+        encoded (string): Hex from a data-cfemail attribute or email-protection link
+
+    Returns:
+        Email string, or None if the value is not valid encoded text
+    """
+    try:
+        data = bytes.fromhex(encoded.strip())
+    except ValueError:
+        return None
+    if len(data) < 2:
+        return None
     try:
-        # Method 1: Look for tel: links
-        tel_links = soup.find_all('a', href=re.compile(r'tel:', re.I))
-        for link in tel_links:
-            href = link.get('href', '')
-            phone_digits = re.sub(r'\D', '', href)
-            if len(phone_digits) >= 10:
-                phone = phone_digits
+        return bytes(byte ^ data[0] for byte in data[1:]).decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+
+
+class _ContactPartsTarget:
+    """
+    lxml parser target that keeps only what contact extraction, contact page
+    discovery and the JavaScript-shell check read, so a page is parsed once
+    and never has to become a full tree in memory
+    """
+
+    def __init__(self):
+        # [href, text] of every <a href>, in document order
+        self.links = []
+        self.has_body_text = False
+        self.empty_app_root = False
+        self.mailto_hrefs = []
+        self.tel_hrefs = []
+        self.data_emails = []
+        self.pieces = []
+        self.section_spans = []
+        self.phone_sections = []
+        self._phone_chunks = []
+        self._offset = 0
+        self._buffer = []
+        # One entry per open element: (skipped, email section, phone section, body, link, app root)
+        self._stack = []
+        # (index into links, text chunks) per open <a href>
+        self._open_links = []
+        # Content seen so far (elements and non-blank text), and its value
+        # when each open app mount point started
+        self._content_count = 0
+        self._app_root_marks = []
+        self._body_depth = 0
+        self._skip_depth = 0
+        self._email_depth = 0
+        self._phone_depth = 0
+
+    def _flush(self):
+        if not self._buffer:
+            return
+        raw = ''.join(self._buffer)
+        self._buffer = []
+        if self._phone_depth:
+            self._phone_chunks.append(raw)
+        text = raw.strip()
+        if not text:
+            return
+        if self._email_depth:
+            self.section_spans.append((self._offset, self._offset + len(text)))
+        self.pieces.append(text)
+        self._offset += len(text) + 1
+
+    def start(self, tag, attrib):
+        self._flush()
+        tag = tag.lower() if isinstance(tag, str) else ''
+        css_class = attrib.get('class', '')
+        skipped = tag in ('script', 'style', 'noscript')
+        email_section = tag in ('footer', 'div', 'section', 'header') and bool(_EMAIL_SECTION_CLASS_RE.search(css_class))
+        phone_section = tag in ('footer', 'div', 'section') and bool(_PHONE_SECTION_CLASS_RE.search(css_class))
+        body = tag == 'body'
+        link = tag == 'a' and 'href' in attrib
+        app_root = tag == 'div' and attrib.get('id') in _APP_ROOT_IDS
+        self._content_count += 1
+        if app_root:
+            self._app_root_marks.append(self._content_count)
+        self._stack.append((skipped, email_section, phone_section, body, link, app_root))
+        self._body_depth += body
+        self._skip_depth += skipped
+        self._email_depth += email_section
+        self._phone_depth += phone_section
+
+        if link:
+            self._open_links.append((len(self.links), []))
+            self.links.append([attrib['href'], ''])
+        if tag == 'a' and not self._skip_depth:
+            href = attrib.get('href', '')
+            if _MAILTO_RE.search(href):
+                self.mailto_hrefs.append(href)
+            elif _TEL_RE.search(href):
+                self.tel_hrefs.append(href)
+            elif _CF_EMAIL_HREF_PREFIX in href:
+                # A mailto: link Cloudflare encoded
+                email = _decode_cf_email(href.split('#', 1)[1])
+                if email:
+                    self.mailto_hrefs.append('mailto:' + email)
+        if 'data-email' in attrib and not self._skip_depth:
+            self.data_emails.append(attrib['data-email'])
+        if 'data-cfemail' in attrib and not self._skip_depth:
+            email = _decode_cf_email(attrib['data-cfemail'])
+            if email:
+                self.data_emails.append(email)
+
+    def end(self, tag):
+        self._flush()
+        if self._stack:
+            skipped, email_section, phone_section, body, link, app_root = self._stack.pop()
+            self._body_depth -= body
+            if app_root and self._app_root_marks:
+                if self._app_root_marks.pop() == self._content_count:
+                    self.empty_app_root = True
+            if link and self._open_links:
+                # Whole link text, script or not, like lxml's text_content()
+                index, chunks = self._open_links.pop()
+                self.links[index][1] = ''.join(chunks).strip()
+            self._skip_depth -= skipped
+            self._email_depth -= email_section
+            self._phone_depth -= phone_section
+            # Outermost phone section closed - keep its text as one block, like get_text()
+            if phone_section and not self._phone_depth:
+                self.phone_sections.append(''.join(self._phone_chunks))
+                self._phone_chunks = []
+
+    def data(self, data):
+        for _, chunks in self._open_links:
+            chunks.append(data)
+        if data and not data.isspace():
+            self._content_count += 1
+        if not self._skip_depth:
+            self._buffer.append(data)
+            if self._body_depth and not self.has_body_text and data and not data.isspace():
+                self.has_body_text = True
+
+    def comment(self, text):
+        # Comments split text nodes
+        self._flush()
+
+    def close(self):
+        self._flush()
+        return self
+
+
+def _parse_contact_parts(page_source):
+    """
+    Runs the single SAX-style lxml pass over raw HTML
+
+    Parameters:
+        page_source (string): HTML content of a page
+
+    Returns:
+        _ContactPartsTarget holding everything the extraction steps read
+    """
+    parser = etree.HTMLParser(target=_ContactPartsTarget(), recover=True)
+    parser.feed(page_source)
+    return parser.close()
+
+
+def extract_contact_info_from_website(page_source):
+    """
+    Enhanced extraction - Uses multiple methods to find emails and phones
+
+    Parameters:
+        page_source (string or _ContactPartsTarget): HTML content of business
+                    website, or the parts _parse_contact_parts already collected
+
+    Returns:
+        Dictionary with contact details
+    """
+    if isinstance(page_source, _ContactPartsTarget):
+        parts = page_source
+        may_have_email = True
+    else:
+        # Raw HTML without an '@' (plain, as an entity or Cloudflare-encoded)
+        # cannot hold an email. Phones get no such shortcut: markup can split
+        # a number ("98765<b>43210</b>") so only the parsed text shows it whole
+        may_have_email = ('@' in page_source or _AT_ENTITY_RE.search(page_source) is not None
+                          or _CF_EMAIL_MARK_RE.search(page_source) is not None)
+
+        # One SAX-style lxml pass collects everything the methods below read,
+        # without building a tree
+        try:
+            parts = _parse_contact_parts(page_source)
+        except Exception as e:
+            print(f"    Could not parse page: {e}")
+            return {'email': None, 'phone': None}
+    page_text = ' '.join(parts.pieces)
+
+    # Method 1: Look for mailto: links (most reliable)
+    email = None
+    if may_have_email:
+        for href in parts.mailto_hrefs:
+            email_match = _MAILTO_EMAIL_RE.search(href)
+            if email_match:
+                email = email_match.group(1).lower()
                 break
-    except:
-        pass
 
-    # Method 2: Multiple phone patterns
+    # Method 2: Look for emails in data-email attributes
+    if may_have_email and not email:
+        for potential_email in parts.data_emails:
+            if '@' in potential_email and '.' in potential_email:
+                email = potential_email.lower()
+                break
+
+    # Method 3: One scan of the page text, ranking candidates by context
+    # (inside a footer/contact section, business-like prefix)
+    if may_have_email and not email:
+        email = _pick_best_email(page_text, parts.section_spans)
+
+    # Method 4: Look for obfuscated emails (e.g., "info [@] company [.] com") as a last resort
+    if may_have_email and not email:
+        email = _find_obfuscated_email(page_text)
+
+    # Extract phone number - tel: links first, then the text of
+    # phone/contact sections (or the whole page when there are none)
+    phone = None
+    for href in parts.tel_hrefs:
+        phone_digits = _NON_DIGIT_RE.sub('', href)
+        if len(phone_digits) >= 10:
+            phone = phone_digits
+            break
     if not phone:
-        try:
-            # Look in contact sections first
-            contact_sections = soup.find_all(['footer', 'div', 'section'], 
-                                            class_=re.compile(r'(contact|footer|phone|tel|call)', re.I))
-            search_text = ' '.join([section.get_text() for section in contact_sections]) if contact_sections else page_source
-            
-            phone_patterns = [
-                r'(\+91[-\s]?)?[6-9]\d{9}',  # Indian mobile
-                r'\+91[-.\s]?\d{10}',  # With country code
-                r'[6-9]\d{2}[-.\s]?\d{3}[-.\s]?\d{4}',  # With separators
-            ]
-            
-            for pattern in phone_patterns:
-                phones = re.findall(pattern, search_text)
-                if phones:
-                    phone_str = phones[0] if isinstance(phones[0], str) else ''.join(phones[0])
-                    phone = re.sub(r'\D', '', phone_str)
-                    if len(phone) >= 10:
-                        break
-        except:
-            pass
+        for section_text in parts.phone_sections or [page_text]:
+            phone = _find_phone(section_text)
+            if phone:
+                break
 
     return {
         'email': email,
@@ -585,54 +1549,95 @@ def scrape_all_results(maps_urls_list):
     Returns:
         List of dictionaries with complete contact info
     """
-    results = []
+    if not maps_urls_list:
+        return []
 
-    for idx, maps_url in enumerate(maps_urls_list, 1):
-        print(f"Processing {idx}/{len(maps_urls_list)}: {maps_url}")
+    total = len(maps_urls_list)
+    workers = min(_SELENIUM_WORKERS, total)
 
-        # Step 1: Get business info from Google Maps
-        maps_data = scrape_google_maps_page(maps_url)
-        
-        business_name = maps_data.get('business_name')
-        phone_from_maps = maps_data.get('phone')
-        website = maps_data.get('website')
-        
-        print(f"  Business: {business_name}")
-        print(f"  Phone from Maps: {phone_from_maps}")
-        print(f"  Website: {website}")
+    # A few pages load in parallel. Each one borrows a warm browser from the
+    # shared pool only while it needs it, so concurrent searches share them too.
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Step 1: Get business info from Google Maps (needs JavaScript)
+        maps_results = list(executor.map(
+            lambda job: _scrape_maps_entry(job[0], total, job[1]),
+            enumerate(maps_urls_list, 1)
+        ))
 
-        # Step 2: If website exists, scrape it for email and additional contact info
-        email = None
-        phone_from_website = None
-        
-        if website:
-            try:
-                print(f"  Scraping website: {website}")
-                website_data = scrape_single_page(website)
-                email = website_data.get('email')
-                phone_from_website = website_data.get('phone')
-                print(f"  Email found: {email}")
-                print(f"  Phone from website: {phone_from_website}")
-            except Exception as e:
-                print(f"  Error scraping website: {e}")
-
-        # Combine data - prefer phone from website, fallback to Maps
-        final_phone = phone_from_website or phone_from_maps
-
-        result = {
-            'business_name': business_name,
-            'email': email,
-            'phone': final_phone,
-            'website': website,
-            'source_url': maps_url
-        }
-        
-        results.append(result)
+        # Step 2: Download every business website at once (plain HTTP, no browser)
+        websites = [website for website in (maps_data.get('website') for maps_data in maps_results)
+                    if website and ('site', website) not in _scrape_cache]
+        print(f"Fetching {len(set(websites))} websites concurrently")
+        pages = fetch_pages(websites)
 
-        # Rate limiting - be respectful
-        time.sleep(2)
+        # Step 3: Extract contact info, using the browser only when the HTML falls short
+        return list(executor.map(
+            lambda maps_data: _combine_maps_result(maps_data, pages),
+            maps_results
+        ))
 
-    return results
+
+def _scrape_maps_entry(idx, total, maps_url):
+    """
+    Scrapes one Google Maps URL from a batch and logs what was found
+
+    Parameters:
+        idx (int): Position of the URL in the batch (for logging)
+        total (int): Size of the batch (for logging)
+        maps_url (string): Google Maps URL to scrape
+
+    Returns:
+        Dictionary with business info from Google Maps
+    """
+    maps_data = scrape_google_maps_page(maps_url)
+
+    print(f"Processed {idx}/{total}: {maps_url}")
+    print(f"  Business: {maps_data.get('business_name')}")
+    print(f"  Phone from Maps: {maps_data.get('phone')}")
+    print(f"  Website: {maps_data.get('website')}")
+    return maps_data
+
+
+def _combine_maps_result(maps_data, pages):
+    """
+    Scrapes a business website and merges it with its Google Maps data
+
+    Parameters:
+        maps_data (dictionary): Output of scrape_google_maps_page
+        pages (dictionary): Prefetched website HTML keyed by URL
+
+    Returns:
+        Dictionary with complete contact info
+    """
+    business_name = maps_data.get('business_name')
+    phone_from_maps = maps_data.get('phone')
+    website = maps_data.get('website')
+
+    # If website exists, scrape it for email and additional contact info
+    email = None
+    phone_from_website = None
+    
+    if website:
+        try:
+            print(f"  Scraping website: {website}")
+            website_data = scrape_single_page(website, page_source=pages.get(website))
+            email = website_data.get('email')
+            phone_from_website = website_data.get('phone')
+            print(f"  Email found: {email}")
+            print(f"  Phone from website: {phone_from_website}")
+        except Exception as e:
+            print(f"  Error scraping website: {e}")
+
+    # Combine data - prefer phone from website, fallback to Maps
+    final_phone = phone_from_website or phone_from_maps
+
+    return {
+        'business_name': business_name,
+        'email': email,
+        'phone': final_phone,
+        'website': website,
+        'source_url': maps_data.get('maps_url')
+    }
 
 
 def scrape_google_search_results(search_term):
@@ -657,51 +1662,108 @@ def scrape_google_search_results(search_term):
         return []
     
     print(f"\nFound {len(website_urls)} websites to scrape\n")
+
+    # Step 2: Download every website at once (plain HTTP, no browser)
+    pages = fetch_pages([url for url in website_urls if ('site', url) not in _scrape_cache])
     
-    # Step 2: Scrape each website
-    results = []
-    
-    for idx, website_url in enumerate(website_urls, 1):
-        print(f"[{idx}/{len(website_urls)}] Processing: {website_url}")
-        
-        try:
-            # Extract business name from URL
-            from urllib.parse import urlparse
-            parsed_url = urlparse(website_url)
-            domain = parsed_url.netloc.replace('www.', '')
-            business_name = domain.split('.')[0].title()
-            
-            # Scrape the website for contact info
-            website_data = scrape_single_page(website_url)
-            
-            email = website_data.get('email')
-            phone = website_data.get('phone')
-            
-            if email:
-                print(f"  ✓ Found email: {email}")
-            if phone:
-                print(f"  ✓ Found phone: {phone}")
-            if not email and not phone:
-                print(f"  ✗ No contact info found")
-            
-            result = {
-                'business_name': business_name,
-                'email': email,
-                'phone': phone,
-                'website': website_url,
-                'source_url': website_url
-            }
-            
-            results.append(result)
-            
-            # Rate limiting
-            time.sleep(1.5)
-            
-        except Exception as e:
-            print(f"  Error processing {website_url}: {e}")
-            continue
+    # Step 3: Scrape each website, using the browser only when the HTML falls short
+    # (a warm one is borrowed from the shared pool for just that site)
+    results = _scrape_search_results(website_urls, pages)
     
     print(f"\n=== Completed: {len(results)} websites processed ===\n")
     return results
 
 
+def _scrape_search_results(website_urls, pages):
+    """
+    Scrapes the Google Search result websites for contact info, a few at a time
+
+    Parameters:
+        website_urls (list): Website URLs from Google Search
+        pages (dictionary): Prefetched website HTML keyed by URL
+
+    Returns:
+        List of dictionaries with contact info (in search result order)
+    """
+    total = len(website_urls)
+    if not total:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(_SELENIUM_WORKERS, total)) as executor:
+        results = executor.map(
+            lambda job: _scrape_search_result(job[0], total, job[1], pages),
+            enumerate(website_urls, 1)
+        )
+        return [result for result in results if result is not None]
+
+
+def _scrape_search_result(idx, total, website_url, pages):
+    """
+    Scrapes one Google Search result website and logs what was found
+
+    Parameters:
+        idx (int): Position of the URL in the results (for logging)
+        total (int): Number of results (for logging)
+        website_url (string): Website to scrape
+        pages (dictionary): Prefetched website HTML keyed by URL
+
+    Returns:
+        Dictionary with contact info, or None if the website could not be processed
+    """
+    print(f"[{idx}/{total}] Processing: {website_url}")
+    
+    try:
+        # Extract business name from URL
+        parsed_url = urlparse(website_url)
+        domain = parsed_url.netloc.replace('www.', '')
+        business_name = domain.split('.')[0].title()
+        
+        # Scrape the website for contact info
+        website_data = scrape_single_page(website_url, page_source=pages.get(website_url))
+        
+        email = website_data.get('email')
+        phone = website_data.get('phone')
+        
+        if email:
+            print(f"  ✓ Found email: {email}")
+        if phone:
+            print(f"  ✓ Found phone: {phone}")
+        if not email and not phone:
+            print(f"  ✗ No contact info found")
+        
+        return {
+            'business_name': business_name,
+            'email': email,
+            'phone': phone,
+            'website': website_url,
+            'source_url': website_url
+        }
+        
+    except Exception as e:
+        print(f"  Error processing {website_url}: {e}")
+        return None
+
+
+def _wait_for_host(url):
+    """
+    Rate limiting - waits until the URL's host is due another request, so
+    one site sees at most one hit every _HOST_INTERVAL seconds across all
+    worker threads
+
+    Parameters:
+        url (string): URL about to be requested
+
+    Returns:
+        None
+    """
+    host = urlparse(url).netloc.lower()
+    with _host_hit_lock:
+        now = time.monotonic()
+        # Hosts whose slot has passed carry no state worth keeping
+        if len(_next_host_hit) > 1000:
+            for stale in [h for h, due in _next_host_hit.items() if due <= now]:
+                del _next_host_hit[stale]
+        due = _next_host_hit.get(host, now)
+        _next_host_hit[host] = max(now, due) + _HOST_INTERVAL
+    if due > now:
+        time.sleep(due - now)
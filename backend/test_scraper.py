@@ -1,22 +1,185 @@
 """
 Quick test to debug email extraction
+
+Run with pytest for the offline checks below (served from fixed HTML, no
+network). Run directly to try the fast method against live websites.
 """
+import io
+
+import diskcache
+import requests
+
 import scraper
 
-# Test the fast scraping method on one of the websites
-test_url = "http://appathaasamayall.com/"
+# Fixed pages standing in for business websites
+_MAILTO_PAGE = """
+<html><body>
+  <h1>Acme Traders</h1>
+  <a href="mailto:Info@Acme-Traders.com">Mail us</a>
+  <a href="tel:+91 98765 43210">Call us</a>
+</body></html>
+"""
+
+_FOOTER_PAGE = """
+<html>
+<head><script>var tracker = "js@analytics.com";</script></head>
+<body>
+  <p>Write to sales@other.in for bulk orders</p>
+  <footer class="site-footer">Reach us at hello@acme.co.in or +91 98765-43210</footer>
+</body></html>
+"""
+
+_EMPTY_PAGE = "<html><body><p>Nothing to see here</p></body></html>"
+
+
+class _FakeSite(requests.adapters.BaseAdapter):
+    """
+    Transport adapter that answers from a dict of URL -> HTML instead of the network
+    """
+
+    def __init__(self, pages):
+        super().__init__()
+        self.pages = pages
+
+    def send(self, request, **kwargs):
+        body = self.pages.get(request.url)
+        response = requests.Response()
+        response.status_code = 200 if body is not None else 404
+        response.headers['Content-Type'] = 'text/html; charset=utf-8'
+        response.encoding = 'utf-8'
+        response.raw = io.BytesIO((body or '').encode('utf-8'))
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def _streamed(html):
+    """
+    Wraps HTML in a Response that _read_body can stream (16 KB chunks)
+    """
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = 'utf-8'
+    response.raw = io.BytesIO(html.encode('utf-8'))
+    return response
+
+
+def _serve(monkeypatch, tmp_path, pages):
+    """
+    Points the scraper's HTTP session and caches at throwaway fakes
+    """
+    session = requests.Session()
+    session.mount('http://', _FakeSite(pages))
+    monkeypatch.setattr(scraper, '_SESSION', session)
+    monkeypatch.setattr(scraper, '_http_cache', diskcache.Cache(str(tmp_path / 'http')))
+    monkeypatch.setattr(scraper, '_scrape_cache', diskcache.Cache(str(tmp_path / 'scrape')))
+    monkeypatch.setattr(scraper, '_HOST_INTERVAL', 0)
+
+
+def test_scrape_with_requests_mailto(monkeypatch, tmp_path):
+    _serve(monkeypatch, tmp_path, {'http://acme.test/': _MAILTO_PAGE})
+
+    result = scraper.scrape_with_requests('http://acme.test/')
+
+    assert result == {'email': 'info@acme-traders.com', 'phone': '919876543210'}
+
+
+def test_scrape_with_requests_unreachable(monkeypatch, tmp_path):
+    _serve(monkeypatch, tmp_path, {})
+
+    assert scraper.scrape_with_requests('http://missing.test/') == {'email': None, 'phone': None}
+
+
+def test_extract_prefers_footer_email_and_skips_scripts():
+    result = scraper.extract_contact_info_from_website(_FOOTER_PAGE)
+
+    assert result['email'] == 'hello@acme.co.in'
+
+
+def test_extract_nothing_found():
+    assert scraper.extract_contact_info_from_website(_EMPTY_PAGE) == {'email': None, 'phone': None}
+
+
+def test_extract_phone_split_by_markup():
+    page = '<div class="contact">Call 98765<b>43210</b></div>'
+
+    assert scraper.extract_contact_info_from_website(page) == {'email': None, 'phone': '9876543210'}
+
+
+def test_read_body_link_across_chunk_boundary():
+    mail = '<a href="mailto:info@acme.com">Mail</a>'
+    tel = '<a href="tel:+91 98765 43210">Call</a>'
+    padding = '<p>' + 'x' * 40000 + '</p>'
+    # Slide the tel: link over the first 16 KB chunk boundary a byte at a time
+    for shift in range(len(tel) + 2):
+        head = '<html><body>' + mail + '<p>'
+        filler = 'x' * (16384 - len(head) - len('</p>') - shift)
+        page = head + filler + '</p>' + tel + padding + '</body></html>'
+
+        text, complete = scraper._read_body(_streamed(page))
+
+        assert not complete
+        assert scraper.extract_contact_info_from_website(text) == {
+            'email': 'info@acme.com', 'phone': '919876543210'}
+
+
+def test_read_body_ignores_links_the_parser_skips():
+    mail = '<a href="mailto:info@acme.com">Mail</a>'
+    tel = '<a href="tel:+91 98765 43210">Call</a>'
+    padding = '<p>' + 'x' * 40000 + '</p>'
+    decoys = [
+        '<script>var a = \'<a href="mailto:js@bundle.com">\';</script>',
+        '<!-- <a href="mailto:old@acme.com">Old</a> -->',
+        # Unquoted href ends at the space: the parser reads only "tel:+91"
+        '<a href=tel:+91 98765 43210>Call</a>',
+    ]
+    for decoy in decoys:
+        for first, last in ((mail, tel), (tel, mail)):
+            # The decoy must not count as a link, or reading stops before the last one
+            page = '<html><body>' + decoy + first + padding + last + padding + '</body></html>'
+
+            text, complete = scraper._read_body(_streamed(page))
+
+            assert not complete
+            assert scraper.extract_contact_info_from_website(text) == {
+                'email': 'info@acme.com', 'phone': '919876543210'}
+
+
+def test_extract_cloudflare_protected_email():
+    # "info@acme.co.in" XORed with key 0x5a, as Cloudflare serves it
+    encoded = '5a' + ''.join(format(ord(char) ^ 0x5a, '02x') for char in 'info@acme.co.in')
+    span = f'<p>Mail <span class="__cf_email__" data-cfemail="{encoded}">[email&#160;protected]</span></p>'
+    link = f'<a href="/cdn-cgi/l/email-protection#{encoded}">[email&#160;protected]</a>'
+
+    assert scraper.extract_contact_info_from_website(span)['email'] == 'info@acme.co.in'
+    assert scraper.extract_contact_info_from_website(link)['email'] == 'info@acme.co.in'
+
+
+def test_needs_browser_for_empty_app_shell():
+    shell = '<html><body><header>Acme</header><div id="root"></div><script src="app.js"></script></body></html>'
+
+    assert scraper._needs_browser(scraper._parse_contact_parts(shell))
+    assert not scraper._needs_browser(scraper._parse_contact_parts(_FOOTER_PAGE))
+
+
+if __name__ == '__main__':
+    # Test the fast scraping method on one of the websites
+    test_url = "http://appathaasamayall.com/"
 
-print(f"Testing email extraction from: {test_url}\n")
+    print(f"Testing email extraction from: {test_url}\n")
 
-# Try fast method
-print("=== Testing Fast Method (requests) ===")
-result = scraper.scrape_with_requests(test_url)
-print(f"Email: {result.get('email')}")
-print(f"Phone: {result.get('phone')}")
+    # Try fast method
+    print("=== Testing Fast Method (requests) ===")
+    result = scraper.scrape_with_requests(test_url)
+    print(f"Email: {result.get('email')}")
+    print(f"Phone: {result.get('phone')}")
 
-# Try another URL
-test_url2 = "https://cockraco.com/"
-print(f"\n\nTesting email extraction from: {test_url2}\n")
-result2 = scraper.scrape_with_requests(test_url2)
-print(f"Email: {result2.get('email')}")
-print(f"Phone: {result2.get('phone')}")
+    # Try another URL
+    test_url2 = "https://cockraco.com/"
+    print(f"\n\nTesting email extraction from: {test_url2}\n")
+    result2 = scraper.scrape_with_requests(test_url2)
+    print(f"Email: {result2.get('email')}")
+    print(f"Phone: {result2.get('phone')}")